@@ -17,23 +17,42 @@ import time
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from faq_retriever import FAQRetriever
+from placement_faq import (COMPANY_INFO, UPCOMING_COMPANIES, INTERVIEW_TIPS, HR_QUESTIONS,
+                           PLACEMENT_FAQ, COMPANY_CATALOGUE)
+
 load_dotenv()
 
+# ---------------------------
+# Logging
+# ---------------------------
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Google Gemini import
 try:
     import google.generativeai as genai
+    GEMINI_AVAILABLE = True
+except ImportError:
+    print("Google Generative AI library not installed. Install with: pip install google-generativeai")
+    GEMINI_AVAILABLE = False
+model = None
+
+def init_gemini():
+    """(Re)create the Gemini client; called again in each forked worker by gunicorn.conf.py"""
+    global model
+    if not GEMINI_AVAILABLE:
+        return
     api_key = os.getenv("GEMINI_API_KEY")
 
     if not api_key:
         raise ValueError("GEMINI_API_KEY not found in environment or .env file")
 
+    # configure() drops any cached clients, so no connection is shared across a fork
     genai.configure(api_key=api_key)
     model = genai.GenerativeModel('gemini-1.5-flash')
-    GEMINI_AVAILABLE = True
-except ImportError:
-    print("Google Generative AI library not installed. Install with: pip install google-generativeai")
-    GEMINI_AVAILABLE = False
-    model = None
+
+init_gemini()
 
 def get_gemini_response(msg, context="general"):
     """Get response from Google Gemini API with context"""
@@ -71,113 +90,29 @@ If a question is about placements, interviews, companies, or career guidance, pr
         logger.error(f"Gemini API error: {str(e)}")
         return None
 
+faq_retriever = FAQRetriever(PLACEMENT_FAQ, COMPANY_CATALOGUE)
+
 def get_placement_specific_response(msg):
     """Check for placement-specific responses first"""
     msg_lower = msg.lower()
     
     # Company-specific information
-    if "synoptek" in msg_lower:
-        return ("Synoptek Placement & Internship Info\n"
-                "Positions & Vacancies (Full-time):\n"
-                "   • Software Engineer → 20 openings\n"
-                "   • Support Engineer → 10 openings\n"
-                "   • Data Analyst → 5 openings\n"
-                "   • Network Engineer → 6 openings\n"
-                "   • Cloud Engineer → 4 openings\n"
-                "Eligibility: Min 60% throughout academics\n"
-                "Requirements: Java/Python, SQL, Networking, Cloud basics\n"
-                "Bond: 2 years\n"
-                "Internship: Software Engineer Intern → 6 months, Stipend ₹20,000/month")
-
-    if "openxcell" in msg_lower or "open excel" in msg_lower:
-        return ("OpenXcell Placement & Internship Info\n"
-                "Positions & Vacancies (Full-time):\n"
-                "   • Software Developer → 15 openings\n"
-                "   • QA Engineer → 8 openings\n"
-                "   • Mobile App Developer (Android/iOS) → 6 openings\n"
-                "   • UI/UX Designer → 4 openings\n"
-                "   • DevOps Engineer → 3 openings\n"
-                "Eligibility: Min 55% aggregate\n"
-                "Requirements: Web Development, Mobile App, Testing, UI/UX\n"
-                "Bond: 2 years\n"
-                "Internship: Mobile App Developer Intern → 4 months, Stipend ₹12,000/month")
-
-    if "einfochips" in msg_lower:
-        return ("eInfochips Placement & Internship Info\n"
-                "Positions & Vacancies (Full-time):\n"
-                "   • Embedded Engineer → 12 openings\n"
-                "   • VLSI Engineer → 10 openings\n"
-                "   • Software Engineer → 18 openings\n"
-                "   • Hardware Design Engineer → 8 openings\n"
-                "   • AI/ML Engineer → 6 openings\n"
-                "   • Verification Engineer → 7 openings\n"
-                "Eligibility: Min 65% aggregate\n"
-                "Requirements: C/C++, Embedded Systems, Digital Electronics, AI/ML\n"
-                "Bond: 3 years\n"
-                "Internship: Embedded Systems Intern → 6 months, Stipend ₹18,000/month")
-
-    if "motadata" in msg_lower:
-        return ("Motadata Placement & Internship Info\n"
-                "Positions & Vacancies (Full-time):\n"
-                "   • Software Engineer (R&D, Product Dev) → 10 openings\n"
-                "   • Backend Developer → 5 openings\n"
-                "   • Frontend Developer → 5 openings\n"
-                "   • DevOps Engineer → 3 openings\n"
-                "Eligibility: Min 60% aggregate\n"
-                "Requirements: Java, Networking, Linux, ReactJS, APIs, Cloud\n"
-                "Bond: 2 years\n"
-                "Internship: QA/Testing Intern → 3 months, Stipend ₹10,000/month")
-
-    if "rtcamp" in msg_lower:
-        return ("RtCamp Placement & Internship Info\n"
-                "Positions & Vacancies (Full-time):\n"
-                "   • Web Developer (WordPress, PHP, JS) → 7 openings\n"
-                "   • Frontend Engineer (ReactJS) → 5 openings\n"
-                "   • Backend Engineer (PHP, Node.js) → 4 openings\n"
-                "   • QA Automation Engineer → 3 openings\n"
-                "   • DevOps Engineer → 2 openings\n"
-                "Eligibility: Min 55% aggregate\n"
-                "Requirements: PHP, JavaScript, React, DevOps, Testing\n"
-                "Bond: No bond mentioned\n"
-                "Internship: Web Developer Intern → 3–6 months, Stipend ₹8,000/month")
+    for company, info in COMPANY_INFO.items():
+        if company in msg_lower:
+            return info
+
+    if "open excel" in msg_lower:
+        return COMPANY_INFO["openxcell"]
 
     if "upcoming companies" in msg_lower or "companies list" in msg_lower:
-        return ("Upcoming Companies & Openings:\n"
-                "1. Synoptek → 45 positions (Software 20, Support 10, Data 5, Network 6, Cloud 4)\n"
-                "2. OpenXcell → 36 positions (Developer 15, QA 8, Mobile 6, UI/UX 4, DevOps 3)\n"
-                "3. eInfochips → 61 positions (Embedded 12, VLSI 10, Software 18, Hardware 8, AI/ML 6, Verification 7)\n"
-                "4. Motadata → 23 positions (Software 10, Backend 5, Frontend 5, DevOps 3)\n"
-                "5. RtCamp → 21 positions (Web 7, Frontend 5, Backend 4, QA 3, DevOps 2)")
+        return UPCOMING_COMPANIES
 
     # Interview and placement specific responses
     if "interview tips" in msg_lower or "interview preparation" in msg_lower:
-        return ("🎯 Interview Success Tips:\n"
-                "📚 Before Interview:\n"
-                "• Research company background, values, recent news\n"
-                "• Review job description and align your skills\n"
-                "• Prepare STAR method examples (Situation, Task, Action, Result)\n"
-                "• Practice common questions aloud\n\n"
-                "💼 During Interview:\n"
-                "• Arrive 10 minutes early\n"
-                "• Maintain eye contact and confident posture\n"
-                "• Ask thoughtful questions about role and company\n"
-                "• Be specific with examples and achievements\n\n"
-                "📝 Follow-up:\n"
-                "• Send thank-you email within 24 hours\n"
-                "• Reiterate your interest and key qualifications")
+        return INTERVIEW_TIPS
 
     if "hr questions" in msg_lower or "common interview questions" in msg_lower:
-        return ("🗣️ Common HR Interview Questions & Tips:\n\n"
-                "1. 'Tell me about yourself'\n"
-                "   → 2-minute elevator pitch: background, skills, career goals\n\n"
-                "2. 'Why do you want this job?'\n"
-                "   → Connect your goals with company's mission\n\n"
-                "3. 'What are your strengths/weaknesses?'\n"
-                "   → Real strengths with examples, weaknesses you're working on\n\n"
-                "4. 'Where do you see yourself in 5 years?'\n"
-                "   → Show growth mindset aligned with company path\n\n"
-                "5. 'Why should we hire you?'\n"
-                "   → Unique value proposition with concrete examples")
+        return HR_QUESTIONS
 
     # Return None if no placement-specific response found
     return None
@@ -223,6 +158,11 @@ def get_bot_response(msg):
     if placement_response:
         return placement_response
     
+    # Offline FAQ retrieval before falling through to Gemini
+    faq_response = faq_retriever.answer(msg)
+    if faq_response:
+        return faq_response
+    
     # Determine context for Gemini
     context = "placement" if is_placement_related(msg) else "general"
     
@@ -251,12 +191,6 @@ app = Flask(__name__, static_folder="public", static_url_path="/")
 app.secret_key = os.getenv('SECRET_KEY', secrets.token_hex(16))
 CORS(app)  # Enable CORS
 
-# ---------------------------
-# Logging
-# ---------------------------
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
 # ---------------------------
 # Download NLTK data if missing
 # ---------------------------
@@ -662,6 +596,7 @@ def health_check():
         "message": "Universal PlaceGrad Bot API is running",
         "version": "3.0.0",
         "gemini_available": GEMINI_AVAILABLE,
+        "faq_retrieval": faq_retriever.stats(),
         "features": [
             "Universal Question Answering",
             "Resume Analysis",
@@ -691,4 +626,5 @@ if __name__ == "__main__":
     else:
         print("💡 Running with fallback responses only")
     print("🔗 Server will be available at: http://127.0.0.1:5000")
+    print("⚠️ Development server only - use `python serve.py` in production")
     app.run(debug=True, host="0.0.0.0", port=5000)
\ No newline at end of file
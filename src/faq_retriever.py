@@ -0,0 +1,306 @@
+"""Offline FAQ retrieval for the PlaceGrad chatbot.
+
+Builds a character n-gram TF-IDF index over a list of FAQ entries once at
+startup and answers paraphrased questions locally, so only real misses have
+to go to Gemini. Pure standard library on purpose - it is imported by the
+Flask app on every boot.
+
+Run ``python faq_retriever.py`` to benchmark index build time, answer()
+latency and accuracy on held-out paraphrases over a few thousand synthetic
+entries.
+"""
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.5
+# Catalogue lines are short facts rather than questions, so a query rarely
+# matches one as closely; they get a lower bar but must clearly point at
+# a single company (the runner-up company must trail by this margin)
+CATALOGUE_THRESHOLD = 0.35
+CATALOGUE_MARGIN = 0.1
+# Share of the query's content words the FAQ vocabulary must know. Stops
+# "eligibility criteria for voting" from landing on "eligibility criteria"
+MIN_COVERAGE = 0.75
+# A word counts as known when this share of its n-grams appear in the FAQ,
+# which lets plurals and typos through
+KNOWN_WORD_OVERLAP = 0.75
+NGRAM_RANGE = (3, 5)
+# n-grams found in more than this share of questions carry almost no signal
+# but dominate query time, so they are left out of the index (sklearn's max_df)
+MAX_DF = 0.3
+
+# Question filler ("how to", "what is the") would otherwise carry the score,
+# so only content words are turned into n-grams
+STOPWORDS = frozenset("""
+a about all am an and any are as at be been by can could did do does for from
+get give had has have how i if in is it its know let me my need of on or our
+please s should so some tell that the there these this those to us want was we
+what when where which who why will with would you your
+""".split())
+
+
+def content_words(text):
+    """Lowercase, strip punctuation and drop stopwords"""
+    text = re.sub(r'[^a-z0-9\s]', ' ', text.lower())
+    return [word for word in text.split() if word not in STOPWORDS]
+
+
+def word_ngrams(word, ngram_range=NGRAM_RANGE):
+    min_n, max_n = ngram_range
+    padded = f" {word} "
+    grams = []
+    for n in range(min_n, max_n + 1):
+        if len(padded) < n:
+            break
+        grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+def char_ngrams(text, ngram_range=NGRAM_RANGE):
+    """Split the content words of text into word-bounded character n-grams (like sklearn's char_wb)"""
+    return [gram for word in content_words(text) for gram in word_ngrams(word, ngram_range)]
+
+
+class FAQRetriever:
+    """Cosine-similarity lookup over a precomputed TF-IDF inverted index.
+
+    ``entries`` is a list of ``(questions, answer)`` pairs; every phrasing in
+    ``questions`` is indexed as its own document pointing at ``answer``.
+    ``catalogue`` has the same shape but holds reference lines (one company
+    fact per line). It shares the index and is only consulted when no
+    curated question clears ``threshold``.
+    """
+
+    def __init__(self, entries, catalogue=(), threshold=DEFAULT_THRESHOLD,
+                 catalogue_threshold=CATALOGUE_THRESHOLD):
+        self.threshold = threshold
+        self.catalogue_threshold = catalogue_threshold
+        self.answers = []
+        self.doc_answer = []
+        self.doc_text = []
+        self.doc_is_catalogue = []
+        self.idf = {}
+        self.max_idf = 1.0
+        self.common = frozenset()
+        self.vocabulary = frozenset()
+        self.postings = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        start = time.perf_counter()
+        self._build(entries, catalogue)
+        self.build_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"FAQ index built: {self.doc_is_catalogue.count(False)} questions, "
+                    f"{self.doc_is_catalogue.count(True)} catalogue lines, "
+                    f"{len(self.idf)} n-grams in {self.build_ms:.1f} ms")
+
+    def _build(self, entries, catalogue):
+        doc_counts = []
+        for is_catalogue, source in ((False, entries), (True, catalogue)):
+            for questions, answer in source:
+                answer_id = len(self.answers)
+                self.answers.append(answer)
+                for question in questions:
+                    counts = Counter(char_ngrams(question))
+                    if not counts:
+                        continue
+                    doc_counts.append(counts)
+                    self.doc_answer.append(answer_id)
+                    self.doc_text.append(question)
+                    self.doc_is_catalogue.append(is_catalogue)
+
+        n_docs = len(doc_counts)
+        df = Counter()
+        for counts in doc_counts:
+            df.update(counts.keys())
+        max_df = max(1, int(MAX_DF * n_docs))
+        self.max_idf = math.log(1 + n_docs) + 1
+        self.idf = {
+            gram: math.log((1 + n_docs) / (1 + freq)) + 1
+            for gram, freq in df.items() if freq <= max_df
+        }
+        self.common = frozenset(gram for gram, freq in df.items() if freq > max_df)
+        self.vocabulary = frozenset(df)
+
+        postings = defaultdict(list)
+        for doc_id, counts in enumerate(doc_counts):
+            for gram, weight in self._normalized_weights(counts).items():
+                postings[gram].append((doc_id, weight))
+        # Tuples keep the index immutable once built
+        self.postings = {gram: tuple(docs) for gram, docs in postings.items()}
+
+    def _normalized_weights(self, counts):
+        # n-grams the FAQ has never seen get the rarest possible weight, so
+        # unknown words pull the score down instead of being silently ignored;
+        # only indexed n-grams are kept for scoring
+        weights = {
+            gram: (1 + math.log(tf)) * self.idf.get(gram, self.max_idf)
+            for gram, tf in counts.items() if gram not in self.common
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        if not norm:
+            return {}
+        return {gram: w / norm for gram, w in weights.items() if gram in self.idf}
+
+    def _scores(self, query):
+        query_weights = self._normalized_weights(Counter(char_ngrams(query)))
+        scores = defaultdict(float)
+        postings = self.postings
+        for gram, q_weight in query_weights.items():
+            for doc_id, d_weight in postings[gram]:
+                scores[doc_id] += q_weight * d_weight
+        return scores
+
+    def _best(self, scores, catalogue):
+        """Best ``(answer, score, matched_question)`` in one tier plus the runner-up answer's score"""
+        best = {}
+        for doc_id, score in scores.items():
+            if self.doc_is_catalogue[doc_id] != catalogue:
+                continue
+            answer_id = self.doc_answer[doc_id]
+            if answer_id not in best or score > scores[best[answer_id]]:
+                best[answer_id] = doc_id
+        if not best:
+            return None, 0.0
+        ranked = sorted(best.values(), key=scores.get, reverse=True)
+        doc_id = ranked[0]
+        runner_up = scores[ranked[1]] if len(ranked) > 1 else 0.0
+        return (self.answers[self.doc_answer[doc_id]], scores[doc_id], self.doc_text[doc_id]), runner_up
+
+    def search(self, query, catalogue=False):
+        """Return ``(answer, score, matched_question)`` for the closest entry, or None"""
+        return self._best(self._scores(query), catalogue)[0]
+
+    def coverage(self, query):
+        """Share of the query's content words that the FAQ vocabulary knows"""
+        words = content_words(query)
+        if not words:
+            return 0.0
+        known = 0
+        for word in words:
+            grams = word_ngrams(word)
+            if sum(gram in self.vocabulary for gram in grams) >= KNOWN_WORD_OVERLAP * len(grams):
+                known += 1
+        return known / len(words)
+
+    def answer(self, query):
+        """Return the FAQ answer if it clears the similarity and coverage thresholds, else None
+
+        Curated questions are tried first; a catalogue line only answers
+        when it clears its own threshold and no other company comes close.
+        """
+        start = time.perf_counter()
+        scores = self._scores(query)
+        coverage = self.coverage(query) if scores else 0.0
+        tier = "faq"
+        result, _ = self._best(scores, catalogue=False)
+        score = result[1] if result else 0.0
+        hit = score >= self.threshold and coverage >= MIN_COVERAGE
+        if not hit and coverage >= MIN_COVERAGE:
+            line, runner_up = self._best(scores, catalogue=True)
+            if line and line[1] >= self.catalogue_threshold and line[1] - runner_up >= CATALOGUE_MARGIN:
+                result, score, hit, tier = line, line[1], True, "catalogue"
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            hit_ratio = self.hits / (self.hits + self.misses)
+
+        logger.info(f"FAQ {tier + ' hit' if hit else 'miss'}: score={score:.3f} coverage={coverage:.2f} "
+                    f"matched={result[2] if result else None!r} "
+                    f"latency={elapsed_ms:.2f}ms hit_ratio={hit_ratio:.2%}")
+        return result[0] if hit else None
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "questions_indexed": self.doc_is_catalogue.count(False),
+                "catalogue_lines_indexed": self.doc_is_catalogue.count(True),
+                "ngrams_indexed": len(self.idf),
+                "build_ms": round(self.build_ms, 2),
+                "threshold": self.threshold,
+                "catalogue_threshold": self.catalogue_threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0
+            }
+
+
+# ====================================================
+# BENCHMARK
+# ====================================================
+TOPICS = ['interview', 'resume', 'bond', 'stipend', 'eligibility', 'aptitude',
+          'salary', 'internship', 'coding round', 'hr round', 'offer letter', 'relocation']
+
+# Held out of the index: reordered words, unseen synonyms and a typo
+PARAPHRASES = ['company {i} {t} rules',
+               'tips on the {typo} stage with company {i}',
+               'what is the {typo} policy at company {i}']
+
+
+def _synthetic_entries(count):
+    templates = ['What is the {t} policy for company {i}?',
+                 'How should I prepare for the {t} at company {i}']
+    return [
+        ([template.format(t=TOPICS[i % len(TOPICS)], i=i) for template in templates],
+         f"Answer {i} about {TOPICS[i % len(TOPICS)]}")
+        for i in range(count)
+    ]
+
+
+def _typo(topic, rng):
+    """Swap two adjacent letters inside the topic's longest word"""
+    word = max(topic.split(), key=len)
+    pos = rng.randrange(1, len(word) - 2)
+    typo = word[:pos] + word[pos + 1] + word[pos] + word[pos + 2:]
+    return topic.replace(word, typo)
+
+
+def benchmark(sizes=(500, 2000, 5000), queries=500):
+    import random
+
+    off_topic = ['how to prepare for a marathon', 'what is the capital of france',
+                 'eligibility criteria for voting', 'recipe for pasta', 'how do i renew my passport']
+    for size in sizes:
+        rng = random.Random(size)
+        entries = _synthetic_entries(size)
+        retriever = FAQRetriever(entries)
+        expected = list(range(0, size, max(1, size // queries)))[:queries]
+
+        latencies = []
+        correct = wrong = 0
+        for n, i in enumerate(expected):
+            topic = TOPICS[i % len(TOPICS)]
+            probe = PARAPHRASES[n % len(PARAPHRASES)].format(t=topic, typo=_typo(topic, rng), i=i)
+            start = time.perf_counter()
+            answer = retriever.answer(probe)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if answer == entries[i][1]:
+                correct += 1
+            elif answer is not None:
+                wrong += 1
+        latencies.sort()
+        false_hits = sum(retriever.answer(probe) is not None for probe in off_topic)
+
+        print(f"{size:>6} entries ({len(retriever.doc_text)} questions): "
+              f"build {retriever.build_ms:8.1f} ms | "
+              f"answer() mean {sum(latencies) / len(latencies):6.2f} ms, "
+              f"p95 {latencies[int(len(latencies) * 0.95)]:6.2f} ms | "
+              f"paraphrases answered correctly {correct / len(expected):.1%}, "
+              f"wrongly {wrong / len(expected):.1%} | "
+              f"off-topic hits {false_hits}/{len(off_topic)}")
+
+
+if __name__ == "__main__":
+    benchmark()
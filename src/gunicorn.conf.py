@@ -0,0 +1,111 @@
+"""Gunicorn configuration for running PlaceGrad in production.
+
+Picked up automatically by ``gunicorn app:app`` from this directory, or
+started via ``python serve.py``.
+
+The app (resume analyzer vocabulary, canned responses, FAQ index) is
+imported once in the master and frozen against the GC so its pages stay
+shared across forks. Network clients are not safe to share, so Gemini is
+re-created in every worker after the fork.
+"""
+import gc
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+_BOOT_START = time.perf_counter()
+
+# ---------------------------
+# Server
+# ---------------------------
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") != "0"
+
+# Gunicorn reads this file before it preloads the app, so switching the
+# collector off here keeps it from touching (and un-sharing) pages while
+# the app loads; when_ready freezes the result and turns it back on. A HUP
+# re-reads this file without calling when_ready again, hence the freeze check
+if preload_app and not gc.get_freeze_count():
+    gc.disable()
+
+def usable_cpus():
+    """CPUs this process may run on, which is less than the host's inside a container"""
+    if hasattr(os, "process_cpu_count"):
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return multiprocessing.cpu_count()
+
+
+# Workers follow the cores; Gemini calls mostly wait on the network, so a
+# fixed number of threads per worker carries the extra concurrency
+workers = int(os.getenv("WEB_CONCURRENCY", usable_cpus() + 1))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = 30
+keepalive = 5
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = 100
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+
+# ---------------------------
+# Memory reporting
+# ---------------------------
+def memory_usage():
+    """Return (rss, pss, shared) in MB for the current process"""
+    try:
+        fields = {}
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[1].isdigit():
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+        shared = fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0)
+        return fields["Rss"] / 1024, fields["Pss"] / 1024, shared / 1024
+    except (OSError, KeyError):
+        # No smaps outside Linux: peak RSS is the best we can do. ru_maxrss
+        # is in bytes on macOS and in kilobytes elsewhere
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak /= 1024 * 1024 if sys.platform == "darwin" else 1024
+        return peak, peak, 0.0
+
+
+# ---------------------------
+# Server hooks
+# ---------------------------
+# Hooks read server.cfg rather than the globals above: command line flags
+# such as --workers or --preload override this file
+def when_ready(server):
+    cfg = server.cfg
+    if cfg.preload_app:
+        gc.freeze()
+    gc.enable()
+    rss, pss, shared = memory_usage()
+    server.log.info(
+        f"PlaceGrad master ready in {(time.perf_counter() - _BOOT_START) * 1000:.0f} ms "
+        f"(preload={'on' if cfg.preload_app else 'off'}, frozen objects={gc.get_freeze_count()}, "
+        f"RSS {rss:.1f} MB) - {cfg.workers} workers x {cfg.threads} threads"
+    )
+
+
+def post_fork(server, worker):
+    worker._placegrad_forked_at = time.perf_counter()
+    if server.cfg.preload_app:
+        import app
+        app.init_gemini()
+
+
+def post_worker_init(worker):
+    boot_ms = (time.perf_counter() - worker._placegrad_forked_at) * 1000
+    rss, pss, shared = memory_usage()
+    worker.log.info(
+        f"Worker {worker.pid} booted in {boot_ms:.0f} ms - "
+        f"RSS {rss:.1f} MB, PSS {pss:.1f} MB, shared {shared:.1f} MB"
+    )
@@ -0,0 +1,159 @@
+"""Canned placement answers and the curated FAQ served by the chatbot.
+
+Plain data with no third-party imports, so the FAQ index can be built and
+tested without the Flask app.
+"""
+
+COMPANY_INFO = {
+    "synoptek": ("Synoptek Placement & Internship Info\n"
+                 "Positions & Vacancies (Full-time):\n"
+                 "   • Software Engineer → 20 openings\n"
+                 "   • Support Engineer → 10 openings\n"
+                 "   • Data Analyst → 5 openings\n"
+                 "   • Network Engineer → 6 openings\n"
+                 "   • Cloud Engineer → 4 openings\n"
+                 "Eligibility: Min 60% throughout academics\n"
+                 "Requirements: Java/Python, SQL, Networking, Cloud basics\n"
+                 "Bond: 2 years\n"
+                 "Internship: Software Engineer Intern → 6 months, Stipend ₹20,000/month"),
+    "openxcell": ("OpenXcell Placement & Internship Info\n"
+                  "Positions & Vacancies (Full-time):\n"
+                  "   • Software Developer → 15 openings\n"
+                  "   • QA Engineer → 8 openings\n"
+                  "   • Mobile App Developer (Android/iOS) → 6 openings\n"
+                  "   • UI/UX Designer → 4 openings\n"
+                  "   • DevOps Engineer → 3 openings\n"
+                  "Eligibility: Min 55% aggregate\n"
+                  "Requirements: Web Development, Mobile App, Testing, UI/UX\n"
+                  "Bond: 2 years\n"
+                  "Internship: Mobile App Developer Intern → 4 months, Stipend ₹12,000/month"),
+    "einfochips": ("eInfochips Placement & Internship Info\n"
+                   "Positions & Vacancies (Full-time):\n"
+                   "   • Embedded Engineer → 12 openings\n"
+                   "   • VLSI Engineer → 10 openings\n"
+                   "   • Software Engineer → 18 openings\n"
+                   "   • Hardware Design Engineer → 8 openings\n"
+                   "   • AI/ML Engineer → 6 openings\n"
+                   "   • Verification Engineer → 7 openings\n"
+                   "Eligibility: Min 65% aggregate\n"
+                   "Requirements: C/C++, Embedded Systems, Digital Electronics, AI/ML\n"
+                   "Bond: 3 years\n"
+                   "Internship: Embedded Systems Intern → 6 months, Stipend ₹18,000/month"),
+    "motadata": ("Motadata Placement & Internship Info\n"
+                 "Positions & Vacancies (Full-time):\n"
+                 "   • Software Engineer (R&D, Product Dev) → 10 openings\n"
+                 "   • Backend Developer → 5 openings\n"
+                 "   • Frontend Developer → 5 openings\n"
+                 "   • DevOps Engineer → 3 openings\n"
+                 "Eligibility: Min 60% aggregate\n"
+                 "Requirements: Java, Networking, Linux, ReactJS, APIs, Cloud\n"
+                 "Bond: 2 years\n"
+                 "Internship: QA/Testing Intern → 3 months, Stipend ₹10,000/month"),
+    "rtcamp": ("RtCamp Placement & Internship Info\n"
+               "Positions & Vacancies (Full-time):\n"
+               "   • Web Developer (WordPress, PHP, JS) → 7 openings\n"
+               "   • Frontend Engineer (ReactJS) → 5 openings\n"
+               "   • Backend Engineer (PHP, Node.js) → 4 openings\n"
+               "   • QA Automation Engineer → 3 openings\n"
+               "   • DevOps Engineer → 2 openings\n"
+               "Eligibility: Min 55% aggregate\n"
+               "Requirements: PHP, JavaScript, React, DevOps, Testing\n"
+               "Bond: No bond mentioned\n"
+               "Internship: Web Developer Intern → 3–6 months, Stipend ₹8,000/month")
+}
+
+UPCOMING_COMPANIES = ("Upcoming Companies & Openings:\n"
+                      "1. Synoptek → 45 positions (Software 20, Support 10, Data 5, Network 6, Cloud 4)\n"
+                      "2. OpenXcell → 36 positions (Developer 15, QA 8, Mobile 6, UI/UX 4, DevOps 3)\n"
+                      "3. eInfochips → 61 positions (Embedded 12, VLSI 10, Software 18, Hardware 8, AI/ML 6, Verification 7)\n"
+                      "4. Motadata → 23 positions (Software 10, Backend 5, Frontend 5, DevOps 3)\n"
+                      "5. RtCamp → 21 positions (Web 7, Frontend 5, Backend 4, QA 3, DevOps 2)")
+
+INTERVIEW_TIPS = ("🎯 Interview Success Tips:\n"
+                  "📚 Before Interview:\n"
+                  "• Research company background, values, recent news\n"
+                  "• Review job description and align your skills\n"
+                  "• Prepare STAR method examples (Situation, Task, Action, Result)\n"
+                  "• Practice common questions aloud\n\n"
+                  "💼 During Interview:\n"
+                  "• Arrive 10 minutes early\n"
+                  "• Maintain eye contact and confident posture\n"
+                  "• Ask thoughtful questions about role and company\n"
+                  "• Be specific with examples and achievements\n\n"
+                  "📝 Follow-up:\n"
+                  "• Send thank-you email within 24 hours\n"
+                  "• Reiterate your interest and key qualifications")
+
+HR_QUESTIONS = ("🗣️ Common HR Interview Questions & Tips:\n\n"
+                "1. 'Tell me about yourself'\n"
+                "   → 2-minute elevator pitch: background, skills, career goals\n\n"
+                "2. 'Why do you want this job?'\n"
+                "   → Connect your goals with company's mission\n\n"
+                "3. 'What are your strengths/weaknesses?'\n"
+                "   → Real strengths with examples, weaknesses you're working on\n\n"
+                "4. 'Where do you see yourself in 5 years?'\n"
+                "   → Show growth mindset aligned with company path\n\n"
+                "5. 'Why should we hire you?'\n"
+                "   → Unique value proposition with concrete examples")
+
+ELIGIBILITY_INFO = ("📋 Eligibility Criteria (Upcoming Companies):\n"
+                    "• Synoptek → Min 60% throughout academics\n"
+                    "• OpenXcell → Min 55% aggregate\n"
+                    "• eInfochips → Min 65% aggregate\n"
+                    "• Motadata → Min 60% aggregate\n"
+                    "• RtCamp → Min 55% aggregate\n\n"
+                    "Active backlogs usually make you ineligible, so clear them before the drive.")
+
+BOND_INFO = ("📝 Service Bond Details:\n"
+             "• Synoptek → 2 years\n"
+             "• OpenXcell → 2 years\n"
+             "• eInfochips → 3 years\n"
+             "• Motadata → 2 years\n"
+             "• RtCamp → No bond mentioned\n\n"
+             "Always read the bond clause in the offer letter before accepting.")
+
+STIPEND_INFO = ("💰 Internship Duration & Stipend:\n"
+                "• Synoptek → Software Engineer Intern, 6 months, ₹20,000/month\n"
+                "• OpenXcell → Mobile App Developer Intern, 4 months, ₹12,000/month\n"
+                "• eInfochips → Embedded Systems Intern, 6 months, ₹18,000/month\n"
+                "• Motadata → QA/Testing Intern, 3 months, ₹10,000/month\n"
+                "• RtCamp → Web Developer Intern, 3–6 months, ₹8,000/month")
+
+# Curated FAQ for the offline retrieval stage: (question phrasings, answer)
+PLACEMENT_FAQ = [
+    (["interview tips", "how to prepare for an interview", "how do I crack the interview",
+      "what should I do before and during an interview", "tips to clear a job interview"],
+     INTERVIEW_TIPS),
+    (["hr questions", "common hr interview questions", "what do they ask in the hr round",
+      "how to answer tell me about yourself", "hr round preparation"],
+     HR_QUESTIONS),
+    (["eligibility", "eligibility criteria", "what percentage is required for placement",
+      "am I eligible for the placement drive", "minimum percentage to be eligible",
+      "minimum marks required for companies", "cgpa criteria for placement"],
+     ELIGIBILITY_INFO),
+    (["bond", "bond details", "is there a service bond", "how long is the bond period",
+      "do I have to sign a bond", "do companies have a bond period", "bond agreement for freshers"],
+     BOND_INFO),
+    (["stipend", "stipend details", "how much stipend do interns get", "internship stipend per month",
+      "internship duration and stipend", "which companies offer paid internships",
+      "which company pays the highest stipend"],
+     STIPEND_INFO),
+    (["upcoming companies", "which companies are coming for placement",
+      "list of companies visiting campus", "companies visiting this year"],
+     UPCOMING_COMPANIES)
+]
+
+
+def catalogue_lines(info):
+    """Split a COMPANY_INFO card into one searchable line per role or fact"""
+    company, _, body = info.partition("\n")
+    name = company.split(" ", 1)[0]
+    lines = []
+    for line in body.split("\n"):
+        line = line.strip(" •").replace("→", " ")
+        if line and not line.startswith("Positions & Vacancies"):
+            lines.append(f"{name} {line}")
+    return lines
+
+# Company catalogue for the retrieval stage: each line points at its company's card
+COMPANY_CATALOGUE = [(catalogue_lines(info), info) for info in COMPANY_INFO.values()]
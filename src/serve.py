@@ -0,0 +1,22 @@
+"""Production entry point: ``python serve.py`` runs the Flask app under gunicorn.
+
+Settings and fork hooks live in gunicorn.conf.py; extra command line
+arguments are passed straight through to gunicorn (e.g. ``--workers 2``).
+"""
+import os
+import sys
+
+from gunicorn.app.wsgiapp import run
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    os.chdir(BASE_DIR)
+    sys.argv = [sys.argv[0], "--config", os.path.join(BASE_DIR, "gunicorn.conf.py"),
+                *sys.argv[1:], "app:app"]
+    run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import pytest
+
+from faq_retriever import FAQRetriever, char_ngrams
+from placement_faq import (PLACEMENT_FAQ, COMPANY_CATALOGUE, COMPANY_INFO, INTERVIEW_TIPS,
+                           HR_QUESTIONS, ELIGIBILITY_INFO, BOND_INFO, STIPEND_INFO,
+                           UPCOMING_COMPANIES)
+
+ON_TOPIC = [
+    ("How can I prepare for my interview?", INTERVIEW_TIPS),
+    ("tips for job interview", INTERVIEW_TIPS),
+    ("what do they ask in HR round", HR_QUESTIONS),
+    ("eligibility", ELIGIBILITY_INFO),
+    ("what's the minimum percentage needed to be eligible", ELIGIBILITY_INFO),
+    ("minimum cgpa for placement", ELIGIBILITY_INFO),
+    ("bond", BOND_INFO),
+    ("what is the bond period", BOND_INFO),
+    ("do I need to sign a bond", BOND_INFO),
+    ("what is the stipend", STIPEND_INFO),
+    ("how much do interns get paid", STIPEND_INFO),
+    ("which companies are visiting this year", UPCOMING_COMPANIES),
+    ("which company gives the highest stipend", STIPEND_INFO),
+    ("companies with no bond", BOND_INFO),
+    # Answered from the company catalogue
+    ("which company is hiring VLSI engineers", COMPANY_INFO["einfochips"]),
+    ("openings for embedded engineers", COMPANY_INFO["einfochips"]),
+    ("who is hiring ui/ux designers", COMPANY_INFO["openxcell"]),
+    ("which company needs wordpress developers", COMPANY_INFO["rtcamp"]),
+    ("company hiring data analysts", COMPANY_INFO["synoptek"]),
+]
+
+OFF_TOPIC = [
+    "how to prepare for GATE exam",
+    "how to prepare for a date",
+    "what is the eligibility criteria for voting in india",
+    "what percentage is required for MBA admission",
+    "how many openings are there in the sea",
+    "what is a chemical bond",
+    "eligibility for a passport",
+    "tips to clear an exam",
+    "explain binary search in python",
+    # Several companies hire software engineers, so no single card answers it
+    "software engineer openings",
+]
+
+
+@pytest.fixture(scope="module")
+def retriever():
+    return FAQRetriever(PLACEMENT_FAQ, COMPANY_CATALOGUE)
+
+
+def test_char_ngrams_drops_punctuation_and_stopwords():
+    assert char_ngrams("Bond?!") == char_ngrams("bond")
+    assert char_ngrams("what is the bond") == char_ngrams("bond")
+    assert char_ngrams("what is the") == []
+
+
+@pytest.mark.parametrize("query, expected", ON_TOPIC)
+def test_on_topic_queries_hit(retriever, query, expected):
+    assert retriever.answer(query) == expected
+
+
+@pytest.mark.parametrize("query", OFF_TOPIC)
+def test_off_topic_queries_miss(retriever, query):
+    assert retriever.answer(query) is None
+
+
+@pytest.mark.parametrize("query", ["", "   ", "?!...", "what is the"])
+def test_empty_queries_miss(retriever, query):
+    assert retriever.search(query) is None
+    assert retriever.answer(query) is None
+
+
+def test_threshold_controls_hits():
+    entries = [(["bond details"], "bond answer")]
+    assert FAQRetriever(entries, threshold=0.5).answer("bond") == "bond answer"
+    assert FAQRetriever(entries, threshold=1.01).answer("bond") is None
+
+
+def test_catalogue_does_not_crowd_out_curated_answers(retriever):
+    # "eligibility" appears on every company card as well as in the FAQ
+    assert retriever.answer("eligibility") == ELIGIBILITY_INFO
+    assert retriever.search("eligibility", catalogue=True)[0] in COMPANY_INFO.values()
+
+
+def test_stats_track_hit_ratio():
+    retriever = FAQRetriever(PLACEMENT_FAQ, COMPANY_CATALOGUE)
+    assert retriever.stats()["hit_ratio"] == 0.0
+
+    retriever.answer("bond")
+    retriever.answer("what is the capital of france")
+    stats = retriever.stats()
+
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["questions_indexed"] == sum(len(questions) for questions, _ in PLACEMENT_FAQ)
+    assert stats["catalogue_lines_indexed"] == sum(len(lines) for lines, _ in COMPANY_CATALOGUE)